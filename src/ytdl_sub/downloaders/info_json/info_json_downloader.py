@@ -1,6 +1,6 @@
 import copy
 import json
-from pathlib import Path
+import os
 from typing import Dict
 from typing import Iterable
 from typing import List
@@ -76,9 +76,9 @@ class InfoJsonDownloader(SourcePlugin[InfoJsonDownloaderOptions]):
             if file_name.endswith(".info.json"):
                 try:
                     with open(
-                        Path(self.output_directory) / file_name, "r", encoding="utf-8"
+                        os.path.join(self.output_directory, file_name), "rb"
                     ) as maybe_info_json:
-                        entry_dict = json.load(maybe_info_json)
+                        entry_dict = json.loads(maybe_info_json.read())
                 except Exception as exc:
                     raise ValidationException(
                         "info.json file cannot be loaded - subscription cannot be reformatted"
@@ -152,9 +152,9 @@ class InfoJsonDownloader(SourcePlugin[InfoJsonDownloaderOptions]):
 
         for file_name in entry_file_names:
             ext = get_file_extension(file_name)
-            file_path = Path(self.output_directory) / file_name
-            working_directory_file_path = Path(self.working_directory) / entry.base_filename(
-                ext=ext
+            file_path = os.path.join(self.output_directory, file_name)
+            working_directory_file_path = os.path.join(
+                self.working_directory, entry.base_filename(ext=ext)
             )
 
             # NFO files will always get rewritten, so ignore
@@ -158,8 +158,9 @@ class YTDLP:
         ]
 
         for info_json_path in info_json_paths:
-            with open(info_json_path, "r", encoding="utf-8") as file:
-                entry_dicts.append(json.load(file))
+            # Parse the raw bytes directly to skip the text-mode decoding layer
+            with open(info_json_path, "rb") as file:
+                entry_dicts.append(json.loads(file.read()))
 
         return entry_dicts
 
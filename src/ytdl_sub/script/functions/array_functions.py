@@ -13,8 +13,10 @@ from ytdl_sub.script.types.resolvable import Resolvable
 from ytdl_sub.script.utils.exceptions import UNREACHABLE
 from ytdl_sub.script.utils.exceptions import ArrayValueDoesNotExist
 from ytdl_sub.script.utils.exceptions import FunctionRuntimeException
+from ytdl_sub.script.utils.purity import pure_functions
 
 
+@pure_functions
 class ArrayFunctions:
     @staticmethod
     def array(maybe_array: AnyArgument) -> Array:
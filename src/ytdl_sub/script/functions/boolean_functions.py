@@ -5,10 +5,12 @@ from ytdl_sub.script.types.resolvable import Boolean
 from ytdl_sub.script.types.resolvable import Float
 from ytdl_sub.script.types.resolvable import Integer
 from ytdl_sub.script.types.resolvable import String
+from ytdl_sub.script.utils.purity import pure_functions
 
 # pylint: disable=invalid-name
 
 
+@pure_functions
 class BooleanFunctions:
     """
     Comparison functions that output Booleans.
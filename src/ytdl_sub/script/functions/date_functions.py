@@ -2,8 +2,10 @@ from datetime import datetime
 
 from ytdl_sub.script.types.resolvable import Integer
 from ytdl_sub.script.types.resolvable import String
+from ytdl_sub.script.utils.purity import pure_functions
 
 
+@pure_functions
 class DateFunctions:
     @staticmethod
     def datetime_strftime(posix_timestamp: Integer, date_format: String) -> String:
@@ -10,6 +10,7 @@ from ytdl_sub.script.types.resolvable import Integer
 from ytdl_sub.script.types.resolvable import Resolvable
 from ytdl_sub.script.types.resolvable import String
 from ytdl_sub.script.utils.exceptions import UNREACHABLE
+from ytdl_sub.script.utils.purity import pure_functions
 
 
 def _from_json(out: Any) -> Resolvable:
@@ -31,6 +32,7 @@ def _from_json(out: Any) -> Resolvable:
     raise UNREACHABLE
 
 
+@pure_functions
 class JsonFunctions:
     @staticmethod
     def from_json(argument: String) -> AnyArgument:
@@ -13,8 +13,10 @@ from ytdl_sub.script.types.resolvable import String
 from ytdl_sub.script.utils.exceptions import FunctionRuntimeException
 from ytdl_sub.script.utils.exceptions import KeyDoesNotExistRuntimeException
 from ytdl_sub.script.utils.exceptions import KeyNotHashableRuntimeException
+from ytdl_sub.script.utils.purity import pure_functions
 
 
+@pure_functions
 class MapFunctions:
     @staticmethod
     def map(maybe_mapping: AnyArgument) -> Map:
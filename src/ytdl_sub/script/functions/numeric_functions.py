@@ -4,6 +4,7 @@ from ytdl_sub.script.types.resolvable import AnyArgument
 from ytdl_sub.script.types.resolvable import Float
 from ytdl_sub.script.types.resolvable import Integer
 from ytdl_sub.script.types.resolvable import Numeric
+from ytdl_sub.script.utils.purity import pure_functions
 
 
 def _to_numeric(value: int | float) -> Numeric:
@@ -12,6 +13,7 @@ def _to_numeric(value: int | float) -> Numeric:
     return Float(value=value)
 
 
+@pure_functions
 class NumericFunctions:
     @staticmethod
     def float(value: AnyArgument) -> Float:
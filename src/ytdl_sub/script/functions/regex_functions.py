@@ -11,6 +11,7 @@ from ytdl_sub.script.types.resolvable import Float
 from ytdl_sub.script.types.resolvable import Integer
 from ytdl_sub.script.types.resolvable import String
 from ytdl_sub.script.utils.exceptions import FunctionRuntimeException
+from ytdl_sub.script.utils.purity import pure_functions
 
 
 def _re_output_to_array(re_out: Match[AnyStr] | None) -> Array:
@@ -20,6 +21,7 @@ def _re_output_to_array(re_out: Match[AnyStr] | None) -> Array:
     return Array(list([String(re_out.string)]) + list(String(group) for group in re_out.groups()))
 
 
+@pure_functions
 class RegexFunctions:
     @staticmethod
     def regex_match(regex: String, string: String) -> Array:
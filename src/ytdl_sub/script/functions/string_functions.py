@@ -7,8 +7,10 @@ from ytdl_sub.script.types.resolvable import Float
 from ytdl_sub.script.types.resolvable import Integer
 from ytdl_sub.script.types.resolvable import Numeric
 from ytdl_sub.script.types.resolvable import String
+from ytdl_sub.script.utils.purity import pure_functions
 
 
+@pure_functions
 class StringFunctions:
     @staticmethod
     def string(value: AnyArgument) -> String:
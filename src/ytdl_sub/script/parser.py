@@ -1,9 +1,12 @@
+import functools
 import json
 from enum import Enum
 from typing import Dict
+from typing import FrozenSet
 from typing import List
 from typing import Optional
 from typing import Set
+from typing import Tuple
 
 from ytdl_sub.script.functions import Functions
 from ytdl_sub.script.types.array import UnresolvedArray
@@ -591,6 +594,28 @@ class _Parser:
         return SyntaxTree(ast=self._ast)
 
 
+# Texts longer than this are not cached, since they are typically one-off entry metadata
+_PARSE_CACHE_MAX_TEXT_LENGTH = 4096
+
+
+@functools.lru_cache(maxsize=1024)
+def _parse_unvalidated(
+    text: str, name: Optional[str]
+) -> Tuple[SyntaxTree, FrozenSet[str], FrozenSet[str]]:
+    """
+    Returns
+    -------
+    The parsed tree of the text, along with the names of the variables and custom functions it
+    references. Syntax trees are immutable, so the same one can be shared across callers.
+    """
+    ast = _Parser(text=text, name=name, custom_function_names=None, variable_names=None).ast
+    return (
+        ast,
+        frozenset(var.name for var in ast.variables),
+        frozenset(func.name for func in ast.custom_functions),
+    )
+
+
 def parse(
     text: str,
     name: Optional[str] = None,
@@ -600,8 +625,24 @@ def parse(
     """
     Entrypoint for parsing ytdl-sub code into a Syntax Tree
     """
+    text = json.dumps(text) if not isinstance(text, str) else text
+
+    # The same format strings get parsed for every entry. Reuse the previously parsed tree
+    # if all of its variables and custom functions exist.
+    if len(text) <= _PARSE_CACHE_MAX_TEXT_LENGTH:
+        try:
+            ast, used_variable_names, used_function_names = _parse_unvalidated(text, name)
+        except UserException:
+            pass
+        else:
+            if (variable_names is None or used_variable_names.issubset(variable_names)) and (
+                custom_function_names is None or used_function_names.issubset(custom_function_names)
+            ):
+                return ast
+
+    # Parse with validation to raise the error with its highlighted position
     return _Parser(
-        text=json.dumps(text) if not isinstance(text, str) else text,
+        text=text,
         name=name,
         custom_function_names=custom_function_names,
         variable_names=variable_names,
@@ -5,6 +5,7 @@ from dataclasses import dataclass
 from typing import Callable
 from typing import Dict
 from typing import List
+from typing import Tuple
 from typing import Type
 from typing import Union
 
@@ -15,8 +16,10 @@ from ytdl_sub.script.types.resolvable import Argument
 from ytdl_sub.script.types.resolvable import BuiltInFunctionType
 from ytdl_sub.script.types.resolvable import FunctionType
 from ytdl_sub.script.types.resolvable import FutureResolvable
+from ytdl_sub.script.types.resolvable import Hashable
 from ytdl_sub.script.types.resolvable import Lambda
 from ytdl_sub.script.types.resolvable import NamedCustomFunction
+from ytdl_sub.script.types.resolvable import NamedType
 from ytdl_sub.script.types.resolvable import Resolvable
 from ytdl_sub.script.types.resolvable import ReturnableArgument
 from ytdl_sub.script.types.resolvable import ReturnableArgumentA
@@ -29,18 +32,47 @@ from ytdl_sub.script.utils.exceptions import UNREACHABLE
 from ytdl_sub.script.utils.exceptions import FunctionRuntimeException
 from ytdl_sub.script.utils.exceptions import RuntimeException
 from ytdl_sub.script.utils.exceptions import UserThrownRuntimeError
+from ytdl_sub.script.utils.purity import is_pure
 from ytdl_sub.script.utils.type_checking import FunctionSpec
+from ytdl_sub.script.utils.type_checking import get_arg_type
 from ytdl_sub.script.utils.type_checking import is_union
 
 
+@functools.lru_cache(maxsize=2048)
+def _call_pure_function(callable_ref: Callable[..., Resolvable], *args: Hashable) -> Resolvable:
+    """
+    Calls a pure built-in function, caching its output by its input arguments
+    """
+    return callable_ref(*args)
+
+
+@functools.lru_cache(maxsize=4096)
+def _is_compatible(
+    name: str,
+    callable_ref: Callable[..., Resolvable],
+    input_arg_types: Tuple[Type[NamedType], ...],
+) -> bool:
+    """
+    Validates a built-in function's input arg types against its spec. Cached since the same
+    function is often called with the same arg types throughout a script.
+    """
+    return FunctionSpec.from_callable(name=name, callable_ref=callable_ref).is_compatible_arg_types(
+        input_arg_types=input_arg_types
+    )
+
+
 @dataclass(frozen=True)
 class Function(FunctionType, VariableDependency, ABC):
+    __slots__ = ()
+
     @property
     def _iterable_arguments(self) -> List[Argument]:
         return self.args
 
 
 class CustomFunction(Function, NamedCustomFunction):
+    __slots__ = ()
+
     def resolve(
         self,
         resolved_variables: Dict[Variable, Resolvable],
@@ -81,11 +113,17 @@ class CustomFunction(Function, NamedCustomFunction):
 
 
 class BuiltInFunction(Function, BuiltInFunctionType):
+    __slots__ = ("_function_spec",)
+
     def validate_args(self) -> "BuiltInFunction":
         """
         Ensures the args are compatible with the BuiltInFunction.
         """
-        if not self.function_spec.is_compatible(input_args=self.args):
+        if not _is_compatible(
+            name=self.name,
+            callable_ref=self.callable,
+            input_arg_types=tuple(get_arg_type(arg) for arg in self.args),
+        ):
             raise FunctionArgumentsExceptionFormatter(
                 input_spec=self.function_spec,
                 function_instance=self,
@@ -110,14 +148,20 @@ class BuiltInFunction(Function, BuiltInFunctionType):
 
     # pylint: enable=missing-raises-doc
 
-    @functools.cached_property
+    @property
     def function_spec(self) -> FunctionSpec:
         """
         Returns
         -------
         The FunctionSpec of the BuiltInFunction
         """
-        return FunctionSpec.from_callable(name=self.name, callable_ref=self.callable)
+        try:
+            return self._function_spec
+        except AttributeError:
+            # Lazily cache it in its slot, bypassing the frozen dataclass' __setattr__
+            function_spec = FunctionSpec.from_callable(name=self.name, callable_ref=self.callable)
+            object.__setattr__(self, "_function_spec", function_spec)
+            return function_spec
 
     @classmethod
     def _arg_output_type(cls, arg: Argument) -> Type[Argument]:
@@ -298,8 +342,14 @@ class BuiltInFunction(Function, BuiltInFunctionType):
                 custom_functions=custom_functions,
             )
 
+        callable_ref = self.callable
         try:
-            return self.callable(*resolved_arguments)
+            # Pure functions with all-hashable args always produce the same output, so cache it
+            if is_pure(callable_ref) and all(
+                isinstance(arg, Hashable) for arg in resolved_arguments
+            ):
+                return _call_pure_function(callable_ref, *resolved_arguments)
+            return callable_ref(*resolved_arguments)
         except (UserThrownRuntimeError, RuntimeException):
             raise
         except Exception as exc:
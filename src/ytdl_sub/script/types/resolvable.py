@@ -2,6 +2,7 @@ import json
 from abc import ABC
 from abc import abstractmethod
 from dataclasses import dataclass
+from dataclasses import fields
 from typing import Any
 from typing import Generic
 from typing import List
@@ -14,6 +15,16 @@ NumericT = TypeVar("NumericT", bound=int | float)
 
 @dataclass(frozen=True)
 class NamedType(ABC):
+    __slots__ = ()
+
+    def __getstate__(self) -> List[Any]:
+        # Explicit state is needed to copy/pickle frozen dataclasses that use __slots__
+        return [getattr(self, field.name) for field in fields(self)]
+
+    def __setstate__(self, state: List[Any]) -> None:
+        for field, value in zip(fields(self), state):
+            object.__setattr__(self, field.name, value)
+
     @classmethod
     def type_name(cls) -> str:
         """
@@ -30,6 +41,8 @@ class Argument(NamedType, ABC):
     Any possible argument type that has not been resolved yet
     """
 
+    __slots__ = ()
+
 
 @dataclass(frozen=True)
 class ValueArgument(Argument, ABC):
@@ -46,6 +59,8 @@ class NamedArgument(Argument, ABC):
     Argument that has an explicit name (i.e. custom function or variable)
     """
 
+    __slots__ = ("name",)
+
     name: str
 
 
@@ -188,6 +203,8 @@ class NamedCustomFunction(NamedArgument, ABC):
     A custom function with a defined name (but unknown args)
     """
 
+    __slots__ = ()
+
 
 @dataclass(frozen=True)
 class ParsedCustomFunction(NamedCustomFunction):
@@ -196,11 +213,15 @@ class ParsedCustomFunction(NamedCustomFunction):
 
 @dataclass(frozen=True)
 class FunctionType(NamedArgument, ABC):
+    __slots__ = ("args",)
+
     args: List[Argument]
 
 
 @dataclass(frozen=True)
 class BuiltInFunctionType(FunctionType, ABC):
+    __slots__ = ()
+
     @abstractmethod
     def output_type(self) -> Type[Resolvable]:
         """
@@ -1,6 +1,7 @@
 from abc import ABC
 from abc import abstractmethod
 from dataclasses import dataclass
+from typing import Container
 from typing import Dict
 from typing import Iterable
 from typing import List
@@ -25,6 +26,8 @@ TypeT = TypeVar("TypeT")
 
 @dataclass(frozen=True)
 class VariableDependency(ABC):
+    __slots__ = ()
+
     @property
     @abstractmethod
     def _iterable_arguments(self) -> List[Argument]:
@@ -34,10 +37,10 @@ class VariableDependency(ABC):
         Any arguments in the VariableDependency that may or may not need to be resolved.
         """
 
-    def _recurse_get(
-        self, ttype: Type[TypeT], subclass: bool = False, instance: bool = True
-    ) -> List[TypeT]:
-        output: List[TypeT] = []
+    def _recurse_get_into(
+        self, output: List[TypeT], ttype: Type[TypeT], subclass: bool, instance: bool
+    ) -> None:
+        # Appends to a single accumulator rather than allocating and merging per recursion level
         for arg in self._iterable_arguments:
             if subclass and issubclass(type(arg), ttype):
                 output.append(arg)
@@ -48,9 +51,14 @@ class VariableDependency(ABC):
 
             if isinstance(arg, VariableDependency):
                 # pylint: disable=protected-access
-                output.extend(arg._recurse_get(ttype, subclass=subclass, instance=instance))
+                arg._recurse_get_into(output, ttype, subclass=subclass, instance=instance)
                 # pylint: enable=protected-access
 
+    def _recurse_get(
+        self, ttype: Type[TypeT], subclass: bool = False, instance: bool = True
+    ) -> List[TypeT]:
+        output: List[TypeT] = []
+        self._recurse_get_into(output, ttype, subclass=subclass, instance=instance)
         return output
 
     @final
@@ -95,15 +103,7 @@ class VariableDependency(ABC):
 
     # pylint: disable=missing-raises-doc
 
-    @final
-    @property
-    def custom_functions(self) -> Set[ParsedCustomFunction]:
-        """
-        Returns
-        -------
-        All CustomFunctions that this depends on.
-        """
-        output: Set[ParsedCustomFunction] = set()
+    def _custom_functions_into(self, output: Set[ParsedCustomFunction]) -> None:
         for arg in self._iterable_arguments:
             if isinstance(arg, NamedCustomFunction):
                 if not isinstance(arg, FunctionType):
@@ -113,8 +113,18 @@ class VariableDependency(ABC):
                 # Custom funcs aren't hashable, so recreate just the base-class portion
                 output.add(ParsedCustomFunction(name=arg.name, num_input_args=len(arg.args)))
             if isinstance(arg, VariableDependency):
-                output.update(arg.custom_functions)
+                arg._custom_functions_into(output)  # pylint: disable=protected-access
 
+    @final
+    @property
+    def custom_functions(self) -> Set[ParsedCustomFunction]:
+        """
+        Returns
+        -------
+        All CustomFunctions that this depends on.
+        """
+        output: Set[ParsedCustomFunction] = set()
+        self._custom_functions_into(output)
         return output
 
     # pylint: enable=missing-raises-doc
@@ -162,21 +172,23 @@ class VariableDependency(ABC):
     @final
     def is_subset_of(
         self,
-        variables: Iterable[Variable],
+        variables: Container[Variable],
         custom_function_definitions: Dict[str, "VariableDependency"],
     ) -> bool:
         """
         Returns
         -------
-        True if it contains all input variables as a dependency. False otherwise.
+        True if all of its variable dependencies (including those within custom functions)
+        are in the input variables. False otherwise.
         """
         for custom_function in self.custom_functions:
-            if custom_function_definitions[custom_function.name].is_subset_of(
+            if not custom_function_definitions[custom_function.name].is_subset_of(
                 variables=variables, custom_function_definitions=custom_function_definitions
             ):
-                return True
+                return False
 
-        return not self.variables.issubset(variables)
+        # Check membership directly to avoid building a set out of the input variables
+        return all(variable in variables for variable in self.variables)
 
     @final
     def contains(
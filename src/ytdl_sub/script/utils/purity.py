@@ -0,0 +1,29 @@
+from typing import Any
+from typing import Callable
+from typing import Type
+from typing import TypeVar
+
+_PURE_ATTRIBUTE = "_pure"
+
+ClassT = TypeVar("ClassT", bound=Type[Any])
+
+
+def pure_functions(cls: ClassT) -> ClassT:
+    """
+    Class decorator that marks every static method of a Functions class as pure, meaning its
+    output depends only on its input arguments and it has no side effects. Pure functions
+    are eligible to have their outputs cached.
+    """
+    for attribute in vars(cls).values():
+        if isinstance(attribute, staticmethod):
+            setattr(attribute.__func__, _PURE_ATTRIBUTE, True)
+    return cls
+
+
+def is_pure(callable_ref: Callable[..., Any]) -> bool:
+    """
+    Returns
+    -------
+    True if the callable was marked as pure. False otherwise.
+    """
+    return getattr(callable_ref, _PURE_ATTRIBUTE, False)
@@ -1,10 +1,16 @@
 # pylint: disable=missing-raises-doc
+import functools
 import inspect
 from dataclasses import dataclass
-from inspect import FullArgSpec
+from typing import Any
 from typing import Callable
+from typing import Dict
+from typing import FrozenSet
 from typing import List
+from typing import NamedTuple
 from typing import Optional
+from typing import Sequence
+from typing import Set
 from typing import Type
 from typing import TypeVar
 from typing import Union
@@ -72,6 +78,35 @@ def _is_union_compatible(
     return False
 
 
+def _all_subclasses(cls: Type) -> Set[Type]:
+    subclasses: Set[Type] = set()
+    to_visit: List[Type] = [cls]
+    while to_visit:
+        for subclass in to_visit.pop().__subclasses__():
+            if subclass not in subclasses:
+                subclasses.add(subclass)
+                to_visit.append(subclass)
+    return subclasses
+
+
+@functools.lru_cache(maxsize=None)
+def _acceptable_classes_for(
+    expected_arg_type: Type[Resolvable | Optional[Resolvable]],
+) -> FrozenSet[Type[NamedType]]:
+    """
+    Returns
+    -------
+    All NamedType classes that are a subclass of the expected type (or any type within it,
+    if it is a union).
+    """
+    expected_types = (
+        expected_arg_type.__args__ if is_union(expected_arg_type) else (expected_arg_type,)
+    )
+    return frozenset(
+        subclass for subclass in _all_subclasses(NamedType) if issubclass(subclass, expected_types)
+    )
+
+
 def _is_type_compatible(
     arg_type: Type[NamedType],
     expected_arg_type: Type[Resolvable | Optional[Resolvable]],
@@ -104,25 +139,62 @@ def _is_type_compatible(
     return True
 
 
-def is_type_compatible(
-    arg: NamedType,
+def get_arg_type(arg: Optional[NamedType]) -> Type[NamedType]:
+    """
+    Returns
+    -------
+    The type of the arg to use when type-checking. Built-in functions and future resolvables
+    use the type they will resolve to.
+    """
+    if isinstance(arg, BuiltInFunctionType):
+        return arg.output_type()  # built-in function
+    if isinstance(arg, FutureResolvable):
+        return arg.future_resolvable_type()
+    return arg.__class__
+
+
+def is_arg_type_compatible(
+    arg_type: Type[NamedType],
     expected_arg_type: Type[Resolvable | Optional[Resolvable]],
 ) -> bool:
     """
     Returns
     -------
-    True if arg is compatible with expected_arg_type. False otherwise.
+    True if arg_type is compatible with expected_arg_type. False otherwise.
     """
-    arg_type: Type[NamedType] = arg.__class__
-    if isinstance(arg, BuiltInFunctionType):
-        arg_type = arg.output_type()  # built-in function
-    elif isinstance(arg, FutureResolvable):
-        arg_type = arg.future_resolvable_type()
+    # Fast path: the arg type is a known subclass of the expected type. Any other
+    # case (unions, lambdas, variables, custom functions) falls through to the full check.
+    return arg_type in _acceptable_classes_for(expected_arg_type) or _is_type_compatible(
+        arg_type, expected_arg_type
+    )
+
+
+class _ArgSpec(NamedTuple):
+    args: List[str]
+    varargs: Optional[str]
+    annotations: Dict[str, Any]
+
+
+def _get_arg_spec(callable_ref: Callable[..., Resolvable]) -> _ArgSpec:
+    """
+    Returns
+    -------
+    The positional arg names, varargs name, and annotations of a function. Reads them directly
+    from the function's code object instead of using inspect.getfullargspec.
+    """
+    code = callable_ref.__code__
+    varargs: Optional[str] = None
+    if code.co_flags & inspect.CO_VARARGS:  # pylint: disable=no-member
+        varargs = code.co_varnames[code.co_argcount + code.co_kwonlyargcount]
 
-    return _is_type_compatible(arg_type, expected_arg_type)
+    return _ArgSpec(
+        args=list(code.co_varnames[: code.co_argcount]),
+        varargs=varargs,
+        annotations=callable_ref.__annotations__,
+    )
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class FunctionSpec:
     function_name: str
     return_type: Type[Resolvable]
@@ -133,46 +205,54 @@ class FunctionSpec:
     def __post_init__(self):
         assert (self.args is None) ^ (self.varargs is None)
 
-    def _is_args_compatible(self, input_args: List[Argument]) -> bool:
+    def _is_args_compatible(self, input_arg_types: Sequence[Type[NamedType]]) -> bool:
         assert self.args is not None
 
-        if len(input_args) > len(self.args):
+        if len(input_arg_types) > len(self.args):
             return False
 
         for idx, arg in enumerate(self.args):
-            input_arg = input_args[idx] if idx < len(input_args) else None
-            if not is_type_compatible(arg=input_arg, expected_arg_type=arg):
+            input_arg_type = input_arg_types[idx] if idx < len(input_arg_types) else type(None)
+            if not is_arg_type_compatible(arg_type=input_arg_type, expected_arg_type=arg):
                 return False
 
         return True
 
-    def _is_varargs_compatible(self, input_args: List[Argument]) -> bool:
+    def _is_varargs_compatible(self, input_arg_types: Sequence[Type[NamedType]]) -> bool:
         """
         Returns
         -------
-        True if the input args are compatible with the spec's varargs. False otherwise.
+        True if the input arg types are compatible with the spec's varargs. False otherwise.
         """
         assert self.varargs is not None
 
-        for input_arg in input_args:
-            if not is_type_compatible(arg=input_arg, expected_arg_type=self.varargs):
+        for input_arg_type in input_arg_types:
+            if not is_arg_type_compatible(arg_type=input_arg_type, expected_arg_type=self.varargs):
                 return False
 
         return True
 
-    def is_compatible(self, input_args: List[Argument]) -> bool:
+    def is_compatible_arg_types(self, input_arg_types: Sequence[Type[NamedType]]) -> bool:
         """
         Returns
         -------
-        True if input_args is compatible. False otherwise.
+        True if input_arg_types (from ``get_arg_type``) is compatible. False otherwise.
         """
         if self.args is not None:
-            return self._is_args_compatible(input_args=input_args)
+            return self._is_args_compatible(input_arg_types=input_arg_types)
         if self.varargs is not None:
-            return self._is_varargs_compatible(input_args=input_args)
+            return self._is_varargs_compatible(input_arg_types=input_arg_types)
 
         raise UNREACHABLE  # TODO: functions with no args
 
+    def is_compatible(self, input_args: List[Argument]) -> bool:
+        """
+        Returns
+        -------
+        True if input_args is compatible. False otherwise.
+        """
+        return self.is_compatible_arg_types([get_arg_type(arg) for arg in input_args])
+
     def is_num_args_compatible(self, num_input_args: int) -> bool:
         """
         Returns
@@ -294,7 +374,7 @@ class FunctionSpec:
         -------
         FunctionSpec from a built-in function.
         """
-        arg_spec: FullArgSpec = inspect.getfullargspec(callable_ref)
+        arg_spec = _get_arg_spec(callable_ref)
         if arg_spec.varargs:
             return FunctionSpec(
                 function_name=name,
@@ -93,6 +93,7 @@ class BaseSubscription(ABC):
         )
 
         self._exception: Optional[Exception] = None
+        self._num_entries_since_archive_save: int = 0
 
     @property
     def download_archive(self) -> EnhancedDownloadArchive:
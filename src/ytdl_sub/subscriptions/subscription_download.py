@@ -3,10 +3,12 @@ import logging
 import os
 import shutil
 from abc import ABC
-from pathlib import Path
+from dataclasses import dataclass
 from typing import List
 from typing import Optional
 
+from yt_dlp import DateRange
+
 from ytdl_sub.config.plugin.plugin import Plugin
 from ytdl_sub.config.plugin.plugin import SplitPlugin
 from ytdl_sub.config.plugin.plugin_mapping import PluginMapping
@@ -28,6 +30,9 @@ from ytdl_sub.utils.logger import Logger
 
 logger: logging.Logger = Logger.get()
 
+# Number of entries to move to the output directory between saves of the download archive
+SAVE_DOWNLOAD_ARCHIVE_ENTRY_INTERVAL: int = 25
+
 
 def _get_split_plugin(plugins: List[Plugin]) -> Optional[SplitPlugin]:
     split_plugins = [plugin for plugin in plugins if isinstance(plugin, SplitPlugin)]
@@ -39,6 +44,68 @@ def _get_split_plugin(plugins: List[Plugin]) -> Optional[SplitPlugin]:
     return None
 
 
+def _remove_empty_subdirectories(dir_path: str) -> bool:
+    """
+    Removes every empty subdirectory of dir_path (excluding dir_path itself), deleting children
+    before their parents in a single walk. Symlinks are not followed.
+
+    Returns
+    -------
+    True if dir_path is empty after removing its empty subdirectories. False otherwise.
+    """
+    is_empty = True
+    with os.scandir(dir_path) as dir_entries:
+        sub_dirs: List[str] = []
+        for entry in dir_entries:
+            if entry.is_dir(follow_symlinks=False):
+                sub_dirs.append(entry.path)
+            else:
+                is_empty = False
+
+    for sub_dir in sub_dirs:
+        if _remove_empty_subdirectories(sub_dir):
+            os.rmdir(sub_dir)
+        else:
+            is_empty = False
+
+    return is_empty
+
+
+@dataclass(frozen=True)
+class _OrderedPlugins:
+    """
+    Plugins ordered for each per-entry operation. Plugin order is static, so this is computed
+    once per subscription instead of once per entry.
+    """
+
+    modify_entry_metadata: List[Plugin]
+    modify_entry: List[Plugin]
+    modify_entry_before_split: List[Plugin]
+    modify_entry_after_split: List[Plugin]
+    post_process: List[Plugin]
+
+    @classmethod
+    def from_plugins(cls, plugins: List[Plugin]) -> "_OrderedPlugins":
+        """
+        Returns
+        -------
+        The plugins ordered for each per-entry operation
+        """
+        return cls(
+            modify_entry_metadata=PluginMapping.order_plugins_by(
+                plugins, PluginOperation.MODIFY_ENTRY_METADATA
+            ),
+            modify_entry=PluginMapping.order_plugins_by(plugins, PluginOperation.MODIFY_ENTRY),
+            modify_entry_before_split=PluginMapping.order_plugins_by(
+                plugins, PluginOperation.MODIFY_ENTRY, before_split=True
+            ),
+            modify_entry_after_split=PluginMapping.order_plugins_by(
+                plugins, PluginOperation.MODIFY_ENTRY, before_split=False
+            ),
+            post_process=PluginMapping.order_plugins_by(plugins, PluginOperation.POST_PROCESS),
+        )
+
+
 class SubscriptionDownload(BaseSubscription, ABC):
     """
     Handles the subscription download logic
@@ -129,38 +196,52 @@ class SubscriptionDownload(BaseSubscription, ABC):
 
         self._delete_working_directory()
 
+    def _save_download_archive(self) -> None:
+        self._num_entries_since_archive_save = 0
+        self.download_archive.save_download_mappings()
+
     @contextlib.contextmanager
     def _maintain_archive_file(self):
         """
         Context manager to initialize the enhanced download archive
         """
+        date_range_to_keep: Optional[DateRange] = None
+        keep_max_files: Optional[int] = None
         if self.maintain_download_archive:
+            self._num_entries_since_archive_save = 0
             self.download_archive.prepare_download_archive()
 
-        yield
-
-        # If output options maintains stale file deletion, perform the delete here prior to saving
-        # the download archive
-        if self.maintain_download_archive:
+            # Resolve stale file deletion options up front, so the post-download cleanup only
+            # performs the deletion and archive flush
             date_range_to_keep = to_date_range(
                 before=self.output_options.keep_files_before,
                 after=self.output_options.keep_files_after,
                 overrides=self.overrides,
             )
-
-            keep_max_files: Optional[int] = None
             if self.output_options.keep_max_files:
                 # validated it can be cast to int within the validator
                 keep_max_files = int(
                     self.overrides.apply_formatter(self.output_options.keep_max_files)
                 )
 
+        try:
+            yield
+        except BaseException:
+            # Persist the entries already moved to the output directory before erroring out,
+            # including on KeyboardInterrupt and SystemExit
+            if self.maintain_download_archive and self._num_entries_since_archive_save > 0:
+                self._save_download_archive()
+            raise
+
+        # If output options maintains stale file deletion, perform the delete here prior to saving
+        # the download archive
+        if self.maintain_download_archive:
             if date_range_to_keep or self.output_options.keep_max_files is not None:
                 self.download_archive.remove_stale_files(
                     date_range=date_range_to_keep, keep_max_files=keep_max_files
                 )
 
-            self.download_archive.save_download_mappings()
+            self._save_download_archive()
             FileHandler.delete(self.download_archive.working_ytdl_file_path)
 
     @contextlib.contextmanager
@@ -169,11 +250,8 @@ class SubscriptionDownload(BaseSubscription, ABC):
             yield
         finally:
             if not self.download_archive.is_dry_run:
-                for root, dir_names, _ in os.walk(Path(self.output_directory), topdown=False):
-                    for dir_name in dir_names:
-                        dir_path = Path(root) / dir_name
-                        if len(os.listdir(dir_path)) == 0:
-                            os.rmdir(dir_path)
+                if os.path.isdir(self.output_directory):
+                    _remove_empty_subdirectories(self.output_directory)
 
     @contextlib.contextmanager
     def _subscription_download_context_managers(self) -> None:
@@ -216,21 +294,23 @@ class SubscriptionDownload(BaseSubscription, ABC):
         FileHandler.delete(entry.get_download_info_json_path())
 
     @classmethod
-    def _preprocess_entry(cls, plugins: List[Plugin], entry: Entry) -> Optional[Entry]:
+    def _preprocess_entry(cls, ordered_plugins: _OrderedPlugins, entry: Entry) -> Optional[Entry]:
         maybe_entry: Optional[Entry] = entry
-        for plugin in PluginMapping.order_plugins_by(
-            plugins, PluginOperation.MODIFY_ENTRY_METADATA
-        ):
+        for plugin in ordered_plugins.modify_entry_metadata:
             if (maybe_entry := plugin.modify_entry_metadata(maybe_entry)) is None:
                 return None
 
         return maybe_entry
 
     def _post_process_entry(
-        self, plugins: List[Plugin], dry_run: bool, entry: Entry, entry_metadata: FileMetadata
+        self,
+        ordered_plugins: _OrderedPlugins,
+        dry_run: bool,
+        entry: Entry,
+        entry_metadata: FileMetadata,
     ):
         # Post-process the entry with all plugins
-        for plugin in PluginMapping.order_plugins_by(plugins, PluginOperation.POST_PROCESS):
+        for plugin in ordered_plugins.post_process:
             optional_plugin_entry_metadata = plugin.post_process_entry(entry)
             if optional_plugin_entry_metadata:
                 entry_metadata.extend(optional_plugin_entry_metadata)
@@ -240,37 +320,49 @@ class SubscriptionDownload(BaseSubscription, ABC):
             dry_run=dry_run, entry=entry, entry_metadata=entry_metadata
         )
 
-        # Re-save the download archive after each entry is moved to the output directory
+        # Periodically re-save the download archive as entries are moved to the output directory.
+        # It is always saved when the subscription finishes or errors
         if self.maintain_download_archive:
-            self.download_archive.save_download_mappings()
+            self._num_entries_since_archive_save += 1
+            if self._num_entries_since_archive_save >= SAVE_DOWNLOAD_ARCHIVE_ENTRY_INTERVAL:
+                self._save_download_archive()
 
     def _process_entry(
-        self, plugins: List[Plugin], dry_run: bool, entry: Entry, entry_metadata: FileMetadata
+        self,
+        ordered_plugins: _OrderedPlugins,
+        dry_run: bool,
+        entry: Entry,
+        entry_metadata: FileMetadata,
     ) -> None:
         entry_: Optional[Entry] = entry
 
         # First, modify the entry with all plugins
-        for plugin in PluginMapping.order_plugins_by(plugins, PluginOperation.MODIFY_ENTRY):
+        for plugin in ordered_plugins.modify_entry:
             # Break if it is None, it is indicated to not process any further
             if (entry_ := plugin.modify_entry(entry_)) is None:
                 break
 
         if entry_:
             self._post_process_entry(
-                plugins=plugins, dry_run=dry_run, entry=entry_, entry_metadata=entry_metadata
+                ordered_plugins=ordered_plugins,
+                dry_run=dry_run,
+                entry=entry_,
+                entry_metadata=entry_metadata,
             )
 
         self._cleanup_entry_files(entry)
 
     def _process_split_entry(
-        self, split_plugin: SplitPlugin, plugins: List[Plugin], dry_run: bool, entry: Entry
+        self,
+        split_plugin: SplitPlugin,
+        ordered_plugins: _OrderedPlugins,
+        dry_run: bool,
+        entry: Entry,
     ) -> None:
         entry_: Optional[Entry] = entry
 
         # First, modify the entry with pre_split plugins
-        for plugin in PluginMapping.order_plugins_by(
-            plugins, PluginOperation.MODIFY_ENTRY, before_split=True
-        ):
+        for plugin in ordered_plugins.modify_entry_before_split:
             # Break if it is None, it is indicated to not process any further
             if (entry_ := plugin.modify_entry(entry_)) is None:
                 break
@@ -280,9 +372,7 @@ class SubscriptionDownload(BaseSubscription, ABC):
             for split_entry, split_entry_metadata in split_plugin.split(entry=entry_):
                 split_entry_: Optional[Entry] = split_entry
 
-                for plugin in PluginMapping.order_plugins_by(
-                    plugins, PluginOperation.MODIFY_ENTRY, before_split=False
-                ):
+                for plugin in ordered_plugins.modify_entry_after_split:
                     # Return if it is None, it is indicated to not process any further.
                     # Break out of the plugin loop
                     if (split_entry_ := plugin.modify_entry(split_entry_)) is None:
@@ -291,7 +381,7 @@ class SubscriptionDownload(BaseSubscription, ABC):
                 # If split_entry is None from modify_entry, do not post process
                 if split_entry_:
                     self._post_process_entry(
-                        plugins=plugins,
+                        ordered_plugins=ordered_plugins,
                         dry_run=dry_run,
                         entry=split_entry_,
                         entry_metadata=split_entry_metadata,
@@ -307,9 +397,14 @@ class SubscriptionDownload(BaseSubscription, ABC):
         downloader: SourcePlugin,
         dry_run: bool,
     ) -> FileHandlerTransactionLog:
+        ordered_plugins = _OrderedPlugins.from_plugins(plugins)
+        split_plugin = _get_split_plugin(plugins)
+
         with self._subscription_download_context_managers():
             for entry in downloader.download_metadata():
-                if (entry := self._preprocess_entry(plugins=plugins, entry=entry)) is None:
+                if (
+                    entry := self._preprocess_entry(ordered_plugins=ordered_plugins, entry=entry)
+                ) is None:
                     continue
 
                 entry = downloader.download(entry)
@@ -320,13 +415,19 @@ class SubscriptionDownload(BaseSubscription, ABC):
                 if isinstance(entry, tuple):
                     entry, entry_metadata = entry
 
-                if split_plugin := _get_split_plugin(plugins):
+                if split_plugin:
                     self._process_split_entry(
-                        split_plugin=split_plugin, plugins=plugins, dry_run=dry_run, entry=entry
+                        split_plugin=split_plugin,
+                        ordered_plugins=ordered_plugins,
+                        dry_run=dry_run,
+                        entry=entry,
                     )
                 else:
                     self._process_entry(
-                        plugins=plugins, dry_run=dry_run, entry=entry, entry_metadata=entry_metadata
+                        ordered_plugins=ordered_plugins,
+                        dry_run=dry_run,
+                        entry=entry,
+                        entry_metadata=entry_metadata,
                     )
 
         for plugin in plugins:
@@ -1,7 +1,9 @@
+import errno
 import hashlib
 import json
 import os
 import shutil
+import stat
 from collections import defaultdict
 from pathlib import Path
 from typing import Any
@@ -33,6 +35,36 @@ def get_file_extension(file_name: Path | str) -> str:
     return file_name.rsplit(".", maxsplit=1)[-1]
 
 
+# copy_file_range errors that mean it is unsupported for the given files, not that the copy failed
+_COPY_FILE_RANGE_UNSUPPORTED_ERRNOS = frozenset(
+    {errno.EXDEV, errno.ENOSYS, errno.EINVAL, errno.EOPNOTSUPP, errno.ENOTSUP, errno.EBADF}
+)
+
+
+def _try_copy_file_range(src_file_path: Union[str, Path], dst_file_path: Union[str, Path]) -> bool:
+    """
+    Tries to copy the file using os.copy_file_range, which copies within the kernel and can
+    reflink on copy-on-write filesystems. Returns False if it is not supported for these files.
+    """
+    if not hasattr(os, "copy_file_range"):
+        return False
+
+    try:
+        with open(src_file_path, "rb") as src, open(dst_file_path, "wb") as dst:
+            remaining = os.fstat(src.fileno()).st_size
+            while remaining > 0:
+                if (copied := os.copy_file_range(src.fileno(), dst.fileno(), remaining)) == 0:
+                    # Some filesystems report nothing copied instead of erroring
+                    return False
+                remaining -= copied
+    except OSError as exc:
+        if exc.errno in _COPY_FILE_RANGE_UNSUPPORTED_ERRNOS:
+            return False
+        raise
+
+    return True
+
+
 def get_md5_hash(contents: str) -> str:
     """
     Helper function to compute md5 hash
@@ -70,9 +102,16 @@ def files_equal(full_file_path_a: Path | str, full_file_path_b: Path | str) -> b
     -------
     True if the files are equal in contents. False otherwise.
     """
-    if not (os.path.isfile(full_file_path_a) and os.path.isfile(full_file_path_b)):
+    # Stat each file once to check both that it is a regular file and its size
+    try:
+        stat_a = os.stat(full_file_path_a)
+        stat_b = os.stat(full_file_path_b)
+    except (OSError, ValueError):
+        return False
+
+    if not (stat.S_ISREG(stat_a.st_mode) and stat.S_ISREG(stat_b.st_mode)):
         return False
-    if os.path.getsize(full_file_path_a) != os.path.getsize(full_file_path_b):
+    if stat_a.st_size != stat_b.st_size:
         return False
     if get_file_md5_hash(full_file_path_a) != get_file_md5_hash(full_file_path_b):
         return False
@@ -370,6 +409,9 @@ class FileHandler:
         self.output_directory = output_directory
         self._file_handler_transaction_log = FileHandlerTransactionLog()
 
+        # Output directories already created by this handler, to avoid re-making them per file
+        self._created_directories: Set[str] = set()
+
     @property
     def file_handler_transaction_log(self) -> FileHandlerTransactionLog:
         """
@@ -392,7 +434,9 @@ class FileHandler:
         # Perform the copy by first writing to a temp file, then moving it.
         # This tries to prevent corrupted writes if the processed dies mid-write,
         atomic_dst = f"{dst_file_path}-ytdl-sub-incomplete"
-        shutil.copyfile(src=src_file_path, dst=atomic_dst)
+        if not _try_copy_file_range(src_file_path=src_file_path, dst_file_path=atomic_dst):
+            # copyfile already uses sendfile where available
+            shutil.copyfile(src=src_file_path, dst=atomic_dst)
         shutil.move(src=atomic_dst, dst=dst_file_path)
 
     @classmethod
@@ -427,8 +471,13 @@ class FileHandler:
         file_path
             File to delete
         """
-        if os.path.isfile(file_path):
+        # Try removing first, the file usually exists. Only check what the path is on failure,
+        # ignoring anything that is not a file (i.e. missing or a directory)
+        try:
             os.remove(file_path)
+        except OSError:
+            if os.path.isfile(file_path):
+                raise
 
     def move_file_to_output_directory(
         self,
@@ -459,8 +508,8 @@ class FileHandler:
             True if modified. False otherwise.
         """
         is_modified = False
-        source_file_path = Path(self.working_directory) / file_name
-        output_file_path = Path(self.output_directory) / output_file_name
+        source_file_path = os.path.join(self.working_directory, file_name)
+        output_file_path = os.path.join(self.output_directory, output_file_name)
 
         # output file exists, and it's not marked as created already, see if we modify it
         if (
@@ -479,7 +528,11 @@ class FileHandler:
             )
 
         if not self.dry_run:
-            os.makedirs(os.path.dirname(output_file_path), exist_ok=True)
+            output_file_directory = os.path.dirname(output_file_path)
+            if output_file_directory not in self._created_directories:
+                os.makedirs(output_file_directory, exist_ok=True)
+                self._created_directories.add(output_file_directory)
+
             if copy_file:
                 self.copy(src_file_path=source_file_path, dst_file_path=output_file_path)
             else:
@@ -500,7 +553,7 @@ class FileHandler:
         file_name
             File in the output directory to delete
         """
-        file_path = Path(self.output_directory) / file_name
+        file_path = os.path.join(self.output_directory, file_name)
         exists = os.path.isfile(file_path)
 
         if exists:
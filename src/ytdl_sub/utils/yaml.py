@@ -12,6 +12,9 @@ from ytdl_sub.utils.logger import Logger
 
 logger = Logger.get(name="yaml")
 
+# Prefer the libyaml-backed loader when PyYAML was built with it
+_SafeLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 
 def load_yaml(file_path: str | Path) -> Dict:
     """
@@ -36,7 +39,7 @@ def load_yaml(file_path: str | Path) -> Dict:
 
     try:
         with open(file_path, "r", encoding="utf-8") as file:
-            output = yaml.safe_load(file)
+            output = yaml.load(file, Loader=_SafeLoader)
     except YAMLError as yaml_exception:
         raise InvalidYamlException(
             f"'{file_path}' has invalid YAML:\n{yaml_exception}\n\n"
@@ -305,16 +305,10 @@ class DownloadMappings:
         -------
         self
         """
-        # Create json string first to ensure it is valid before writing anything to file
+        # Create json string first to ensure it is valid before writing anything to file.
+        # sort_keys orders the entries by uid, so they do not need to be pre-sorted
         json_str = json.dumps(
-            obj={
-                uid: mapping.dict
-                for uid, mapping in sorted(
-                    self._entry_mappings.items(),
-                    key=lambda item: item[1].upload_date,
-                    reverse=True,
-                )
-            },
+            obj={uid: mapping.dict for uid, mapping in self._entry_mappings.items()},
             indent=2,
             sort_keys=True,
         )
@@ -54,43 +54,69 @@ def cleanup_debug_file():
         Logger.cleanup()
 
 
+@pytest.fixture(scope="session")
+def session_working_directory() -> str:
+    """
+    Working directory path shared by every test in the session, so configs that only depend on
+    it can be built once. The ``working_directory`` fixture creates and removes it per test.
+    """
+    with tempfile.TemporaryDirectory() as temp_dir:
+        yield os.path.join(temp_dir, "working_directory")
+
+
 @pytest.fixture
-def working_directory() -> str:
+def working_directory(session_working_directory) -> str:
     """
     Any time the working directory is used, ensure no files remain on cleaning it up
     """
     logger = Logger.get("test")
+    temp_dir = session_working_directory
 
-    with tempfile.TemporaryDirectory() as temp_dir:
+    def _assert_working_directory_empty(self, is_error: bool = False):
+        files = [str(file_path) for file_path in _get_files_in_directory(temp_dir)]
+        num_files = len(files)
+        if os.path.isdir(temp_dir):
+            shutil.rmtree(temp_dir)
 
-        def _assert_working_directory_empty(self, is_error: bool = False):
-            files = [str(file_path) for file_path in _get_files_in_directory(temp_dir)]
-            num_files = len(files)
-            if os.path.isdir(temp_dir):
-                shutil.rmtree(temp_dir)
-
-            if not is_error:
-                if num_files > 0:
-                    logger.error("left-over files in working dir:\n%s", "\n".join(files))
-                assert num_files == 0
+        if not is_error:
+            if num_files > 0:
+                logger.error("left-over files in working dir:\n%s", "\n".join(files))
+            assert num_files == 0
 
+    os.makedirs(temp_dir)
+    try:
         with patch.object(
             SubscriptionDownload,
             "_delete_working_directory",
             new=_assert_working_directory_empty,
         ):
             yield temp_dir
+    finally:
+        shutil.rmtree(temp_dir, ignore_errors=True)
+
+
+@contextlib.contextmanager
+def _session_temp_directory(tmp_path_factory: pytest.TempPathFactory, name: str) -> str:
+    """
+    Creates a numbered directory under the session's base temp directory. Downloaded media can be
+    large, so it is still removed once the test finishes.
+    """
+    temp_dir = str(tmp_path_factory.mktemp(name))
+    try:
+        yield temp_dir
+    finally:
+        shutil.rmtree(temp_dir, ignore_errors=True)
 
 
 @pytest.fixture()
-def output_directory() -> str:
-    with tempfile.TemporaryDirectory() as temp_dir:
+def output_directory(tmp_path_factory) -> str:
+    with _session_temp_directory(tmp_path_factory, "output_directory") as temp_dir:
         yield temp_dir
 
 
 @pytest.fixture()
-def reformat_directory() -> str:
-    with tempfile.TemporaryDirectory() as temp_dir:
+def reformat_directory(tmp_path_factory) -> str:
+    with _session_temp_directory(tmp_path_factory, "reformat_directory") as temp_dir:
         yield temp_dir
 
 
@@ -227,14 +253,21 @@ def music_video_subscription_path() -> Path:
     return Path("examples/music_video_subscriptions.yaml")
 
 
-@pytest.fixture()
+@pytest.fixture(scope="session")
 def tv_show_config_path() -> str:
     return "examples/advanced/tv_show_config.yaml"
 
 
+@pytest.fixture(scope="session")
+def session_tv_show_config(session_working_directory, tv_show_config_path) -> ConfigFile:
+    return _load_config(
+        config_path=Path(tv_show_config_path), working_directory=session_working_directory
+    )
+
+
 @pytest.fixture()
-def tv_show_config(working_directory, tv_show_config_path) -> ConfigFile:
-    return _load_config(config_path=Path(tv_show_config_path), working_directory=working_directory)
+def tv_show_config(working_directory, session_tv_show_config) -> ConfigFile:
+    return session_tv_show_config
 
 
 @pytest.fixture()
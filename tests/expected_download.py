@@ -1,9 +1,11 @@
+import functools
 import json
 import os.path
-from dataclasses import dataclass
 from pathlib import Path
 from typing import List
+from typing import NamedTuple
 from typing import Optional
+from typing import Tuple
 
 from resources import REGENERATE_FIXTURES
 from resources import RESOURCE_PATH
@@ -15,13 +17,13 @@ _EXPECTED_DOWNLOADS_SUMMARY_PATH = RESOURCE_PATH / "expected_downloads_summaries
 
 
 def _get_files_in_directory(relative_directory: Path | str) -> List[Path]:
+    # os.walk uses scandir's file types, so no per-file stat is needed
     relative_file_paths: List[Path] = []
-    for path in Path(relative_directory).rglob("*"):
-        if path.is_file():
-            relative_path = Path(
-                str(path).removeprefix(str(relative_directory)).removeprefix(os.path.sep)
+    for dir_path, _, file_names in os.walk(relative_directory):
+        for file_name in file_names:
+            relative_file_paths.append(
+                Path(os.path.relpath(os.path.join(dir_path, file_name), relative_directory))
             )
-            relative_file_paths.append(relative_path)
 
     return relative_file_paths
 
@@ -32,8 +34,7 @@ def _get_file_md5_hash(full_file_path: str | Path) -> str:
     return get_file_md5_hash(full_file_path=full_file_path)
 
 
-@dataclass
-class ExpectedDownloadFile:
+class ExpectedDownloadFile(NamedTuple):
     path: Path
     md5: str
 
@@ -47,15 +48,16 @@ class ExpectedDownloads:
     try all the hashes (used in case the GitHub env produces different deterministic value).
     """
 
-    def __init__(self, expected_downloads: List[ExpectedDownloadFile]):
+    def __init__(self, expected_downloads: Tuple[ExpectedDownloadFile, ...]):
         self.expected_downloads = expected_downloads
+        self._expected_paths = {download.path for download in expected_downloads}
 
     @property
     def file_count(self) -> int:
         return len(self.expected_downloads)
 
     def contains(self, relative_path: Path) -> bool:
-        return sum(relative_path == download.path for download in self.expected_downloads) == 1
+        return relative_path in self._expected_paths
 
     def assert_files_exist(
         self, relative_directory: str | Path, ignore_md5_hashes_for: Optional[List[str]] = None
@@ -68,6 +70,7 @@ class ExpectedDownloads:
             ignore_md5_hashes_for = []
 
         relative_file_paths = _get_files_in_directory(relative_directory=relative_directory)
+        created_file_paths = set(relative_file_paths)
 
         for file_path in relative_file_paths:
             assert self.contains(file_path), f"File {file_path} was created but not expected"
@@ -77,7 +80,9 @@ class ExpectedDownloads:
         for expected_download in self.expected_downloads:
             path = str(expected_download.path)
             full_path = Path(relative_directory) / path
-            assert os.path.isfile(full_path), f"Expected {path} to be a file but it is not"
+            assert (
+                expected_download.path in created_file_paths
+            ), f"Expected {path} to be a file but it is not"
 
             # TODO: Implement file hash for tests in Windows
             if IS_WINDOWS or path in ignore_md5_hashes_for or path.endswith(".info.json"):
@@ -91,17 +96,17 @@ class ExpectedDownloads:
 
     @classmethod
     def from_dict(cls, expected_downloads_dict) -> "ExpectedDownloads":
-        expected_downloads: List[ExpectedDownloadFile] = []
-        for file_path, md5_hash in expected_downloads_dict.items():
-            expected_downloads.append(ExpectedDownloadFile(path=Path(file_path), md5=md5_hash))
-
-        return cls(expected_downloads=expected_downloads)
+        return cls(
+            expected_downloads=tuple(
+                ExpectedDownloadFile(path=Path(file_path), md5=md5_hash)
+                for file_path, md5_hash in expected_downloads_dict.items()
+            )
+        )
 
     @classmethod
     def from_file(cls, file_path: str | Path) -> "ExpectedDownloads":
-        with open(file_path, mode="r", encoding="utf-8") as file:
-            expected_downloads_dict = json.load(file)
-        return cls.from_dict(expected_downloads_dict)
+        # Tests only read ExpectedDownloads, so share one instance per summary file version
+        return _load_expected_downloads(str(file_path), os.stat(file_path).st_mtime_ns)
 
     @classmethod
     def from_directory(cls, directory_path: str | Path) -> "ExpectedDownloads":
@@ -123,6 +128,14 @@ class ExpectedDownloads:
             )
 
 
+@functools.lru_cache(maxsize=None)
+def _load_expected_downloads(file_path: str, mtime_ns: int) -> ExpectedDownloads:
+    _ = mtime_ns
+    with open(file_path, mode="r", encoding="utf-8") as file:
+        expected_downloads_dict = json.load(file)
+    return ExpectedDownloads.from_dict(expected_downloads_dict)
+
+
 def assert_expected_downloads(
     output_directory: str | Path,
     dry_run: bool,
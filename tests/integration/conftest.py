@@ -1,4 +1,5 @@
 import contextlib
+import functools
 import os
 import shutil
 from pathlib import Path
@@ -18,6 +19,15 @@ from ytdl_sub.entries.script.variable_definitions import VariableDefinitions
 
 v: VariableDefinitions = VARIABLES
 
+# Values shared by every mock entry dict
+_MOCK_ENTRY_DICT_TEMPLATE: Dict = {
+    v.epoch.metadata_key: 1596878400,
+    v.extractor.metadata_key: "mock-entry-extractor",
+    v.extractor_key.metadata_key: "mock-entry-dict",
+    v.ext.metadata_key: "mp4",
+    v.description.metadata_key: "The Description",
+}
+
 
 @pytest.fixture
 def subscription_name(working_directory) -> str:
@@ -26,18 +36,25 @@ def subscription_name(working_directory) -> str:
     return name
 
 
-@pytest.fixture
-def config(working_directory) -> ConfigFile:
+@pytest.fixture(scope="session")
+def session_config(session_working_directory) -> ConfigFile:
     return ConfigFile(
         name="config",
-        value={"configuration": {"working_directory": working_directory}, "presets": {}},
+        value={"configuration": {"working_directory": session_working_directory}, "presets": {}},
     )
 
 
+@pytest.fixture
+def config(working_directory, session_config) -> ConfigFile:
+    return session_config
+
+
 @pytest.fixture
 def mock_downloaded_file_path(working_directory: str, subscription_name: str):
+    subscription_working_directory = Path(working_directory) / subscription_name
+
     def _mock_downloaded_file_path(file_name: str) -> Path:
-        return Path(working_directory) / subscription_name / file_name
+        return subscription_working_directory / file_name
 
     return _mock_downloaded_file_path
 
@@ -55,20 +72,17 @@ def mock_entry_dict_factory(mock_downloaded_file_path) -> Callable:
         is_extracted_audio: bool = False,
     ) -> Dict:
         entry_dict = {
+            **_MOCK_ENTRY_DICT_TEMPLATE,
             v.uid.metadata_key: uid,
-            v.epoch.metadata_key: 1596878400,
             v.duration.metadata_key: 42 if is_extracted_audio else 31,
             v.playlist_title.metadata_key: playlist_title,
             v.playlist_index.metadata_key: playlist_index,
             v.playlist_count.metadata_key: playlist_count,
-            v.extractor.metadata_key: "mock-entry-extractor",
-            v.extractor_key.metadata_key: "mock-entry-dict",
             v.title.metadata_key: f"Mock Entry {uid}",
-            v.ext.metadata_key: "mp4",
             v.upload_date.metadata_key: upload_date,
             v.webpage_url.metadata_key: f"https://{uid}.com",
+            # Nested values are mutated below, so they are built per call
             v.playlist_metadata.metadata_key: {"thumbnails": []},
-            v.description.metadata_key: "The Description",
         }
 
         if is_youtube_channel:
@@ -103,25 +117,22 @@ def mock_entry_dict_factory(mock_downloaded_file_path) -> Callable:
     return _mock_entry_dict_factory
 
 
-@pytest.fixture
-def mock_download_collection_thumbnail(mock_downloaded_file_path):
-    def _mock_download_and_convert_url_thumbnail(
-        thumbnail_url: str, output_thumbnail_path: str
-    ) -> bool:
-        _ = thumbnail_url
-        output_name = os.path.basename(output_thumbnail_path)
-        if "poster" in output_name or "show" in output_name:
-            copy_file_fixture(
-                fixture_name="poster.jpg", output_file_path=Path(output_thumbnail_path)
-            )
-            return True
-        elif "fanart" in output_name:
-            copy_file_fixture(
-                fixture_name="fanart.jpeg", output_file_path=Path(output_thumbnail_path)
-            )
-            return True
-        return False
+def _mock_download_and_convert_url_thumbnail(
+    thumbnail_url: str, output_thumbnail_path: str
+) -> bool:
+    _ = thumbnail_url
+    output_name = os.path.basename(output_thumbnail_path)
+    if "poster" in output_name or "show" in output_name:
+        copy_file_fixture(fixture_name="poster.jpg", output_file_path=Path(output_thumbnail_path))
+        return True
+    elif "fanart" in output_name:
+        copy_file_fixture(fixture_name="fanart.jpeg", output_file_path=Path(output_thumbnail_path))
+        return True
+    return False
+
 
+@pytest.fixture
+def mock_download_collection_thumbnail():
     with patch(
         "ytdl_sub.downloaders.url.downloader.download_and_convert_url_thumbnail",
         new=_mock_download_and_convert_url_thumbnail,
@@ -141,6 +152,11 @@ def mock_download_collection_entries(
         is_dry_run: bool = False,
     ):
         is_real_run = not is_dry_run
+        collection_entry_dict = functools.partial(
+            mock_entry_dict_factory,
+            is_youtube_channel=is_youtube_channel,
+            is_extracted_audio=is_extracted_audio,
+        )
 
         def _write_entries_to_working_dir(*args, **kwargs) -> List[Dict]:
             # Second TV URL or second soundcloud URL, which downloads first
@@ -150,97 +166,79 @@ def mock_download_collection_entries(
                 return []
             if num_urls == 1 or (is_second_url and num_urls > 1):
                 return [
-                    mock_entry_dict_factory(
+                    collection_entry_dict(
                         uid="21-1",
                         upload_date="20210808",
                         playlist_title="Download First",
                         playlist_index=1,
                         playlist_count=4,
-                        is_youtube_channel=is_youtube_channel,
-                        is_extracted_audio=is_extracted_audio,
                         mock_download_to_working_dir=is_real_run,
                     ),  # 1
-                    mock_entry_dict_factory(
+                    collection_entry_dict(
                         uid="20-1",
                         upload_date="20200808",
                         playlist_title="Download First",
                         playlist_index=2,
                         playlist_count=4,
-                        is_youtube_channel=is_youtube_channel,
-                        is_extracted_audio=is_extracted_audio,
                         mock_download_to_working_dir=is_real_run,
                     ),  # 2  98
-                    mock_entry_dict_factory(
+                    collection_entry_dict(
                         uid="20-2",
                         upload_date="20200808",
                         playlist_title="Download First",
                         playlist_index=3,
                         playlist_count=4,
-                        is_youtube_channel=is_youtube_channel,
-                        is_extracted_audio=is_extracted_audio,
                         mock_download_to_working_dir=is_real_run,
                     ),  # 1  99
-                    mock_entry_dict_factory(
+                    collection_entry_dict(
                         uid="20-3",
                         upload_date="20200807",
                         playlist_title="Download First",
                         playlist_index=4,
                         playlist_count=4,
-                        is_youtube_channel=is_youtube_channel,
-                        is_extracted_audio=is_extracted_audio,
                         mock_download_to_working_dir=is_real_run,
                     ),
                 ]
             return [
                 # 20-3 should resolve to collection 1 (which is season 2)
-                mock_entry_dict_factory(
+                collection_entry_dict(
                     uid="20-3",
                     upload_date="20200807",
                     playlist_title="Download Second",
                     playlist_index=1,
                     playlist_count=5,
-                    is_youtube_channel=is_youtube_channel,
-                    is_extracted_audio=is_extracted_audio,
                     mock_download_to_working_dir=False,
                 ),
-                mock_entry_dict_factory(
+                collection_entry_dict(
                     uid="20-4",
                     upload_date="20200806",
                     playlist_title="Download Second",
                     playlist_index=2,
                     playlist_count=5,
-                    is_youtube_channel=is_youtube_channel,
-                    is_extracted_audio=is_extracted_audio,
                     mock_download_to_working_dir=is_real_run,
                 ),
-                mock_entry_dict_factory(
+                collection_entry_dict(
                     uid="20-5",
                     upload_date="20200706",
                     playlist_title="Download Second",
                     playlist_index=3,
                     playlist_count=5,
-                    is_youtube_channel=is_youtube_channel,
-                    is_extracted_audio=is_extracted_audio,
                     mock_download_to_working_dir=is_real_run,
                 ),
-                mock_entry_dict_factory(
+                collection_entry_dict(
                     uid="20-6",
                     upload_date="20200706",
                     playlist_title="Download Second",
                     playlist_index=4,
                     playlist_count=5,
-                    is_youtube_channel=is_youtube_channel,
-                    is_extracted_audio=is_extracted_audio,
                     mock_download_to_working_dir=is_real_run,
                 ),
-                mock_entry_dict_factory(
+                collection_entry_dict(
                     uid="20-7",
                     upload_date="20200606",
                     playlist_title="Download Second",
                     playlist_index=5,
                     playlist_count=5,
-                    is_youtube_channel=is_youtube_channel,
-                    is_extracted_audio=is_extracted_audio,
                     mock_download_to_working_dir=is_real_run,
                 ),
             ]
@@ -17,7 +17,8 @@ def test_working_directory_lock(default_config: ConfigFile):
     if new_pid == 0:  # is child
         with working_directory_lock(config=default_config):
             time.sleep(3)
-        return
+        # Exit without returning, otherwise the forked child continues running the test session
+        os._exit(0)
 
     time.sleep(1)
     with pytest.raises(ValidationException, match="Cannot run two instances of ytdl-sub"):
@@ -1,4 +1,5 @@
 import re
+from typing import Callable
 
 import pytest
 from unit.script.conftest import single_variable_output
@@ -9,46 +10,41 @@ from ytdl_sub.script.utils.exceptions import KeyDoesNotExistRuntimeException
 from ytdl_sub.script.utils.exceptions import KeyNotHashableRuntimeException
 
 
+@pytest.fixture(scope="module")
+def input_map_script_factory() -> Callable[[str], Script]:
+    base_script = {"input_map": "{{'key': 'value'}}"}
+
+    def _input_map_script_factory(output: str) -> Script:
+        return Script({**base_script, "output": output})
+
+    return _input_map_script_factory
+
+
 class TestMapFunctions:
-    def test_map_get(self):
+    def test_map_get(self, input_map_script_factory):
         output = (
-            Script(
-                {
-                    "input_map": "{{'key': 'value'}}",
-                    "output": "{%map_get(input_map, 'key')}",
-                }
-            )
+            input_map_script_factory("{%map_get(input_map, 'key')}")
             .resolve(update=True)
             .get("output")
             .native
         )
         assert output == "value"
 
-    def test_map_get_optional(self):
+    def test_map_get_optional(self, input_map_script_factory):
         output = (
-            Script(
-                {
-                    "input_map": "{{'key': 'value'}}",
-                    "output": "{%map_get(input_map, 'dne', 'optional_value')}",
-                }
-            )
+            input_map_script_factory("{%map_get(input_map, 'dne', 'optional_value')}")
             .resolve(update=True)
             .get("output")
             .native
         )
         assert output == "optional_value"
 
-    def test_map_get_errors_missing_key(self):
+    def test_map_get_errors_missing_key(self, input_map_script_factory):
         with pytest.raises(
             KeyDoesNotExistRuntimeException,
             match=re.escape("Tried to call %map_get with key dne, but it does not exist"),
         ):
-            Script(
-                {
-                    "input_map": "{{'key': 'value'}}",
-                    "output": "{%map_get(input_map, 'dne')}",
-                }
-            ).resolve()
+            input_map_script_factory("{%map_get(input_map, 'dne')}").resolve()
 
     def test_map_get_errors_key_not_hashable(self):
         with pytest.raises(
@@ -71,14 +67,11 @@ class TestMapFunctions:
             ("%string(%array_at(['dne', 'key'], 1))", True),
         ],
     )
-    def test_map_contains(self, contains_value: str, expected_value: bool):
+    def test_map_contains(
+        self, input_map_script_factory, contains_value: str, expected_value: bool
+    ):
         output = (
-            Script(
-                {
-                    "input_map": "{{'key': 'value'}}",
-                    "output": f"{{%map_contains(input_map, {contains_value})}}",
-                }
-            )
+            input_map_script_factory(f"{{%map_contains(input_map, {contains_value})}}")
             .resolve(update=True)
             .get("output")
             .native
@@ -12,6 +12,16 @@ from ytdl_sub.script.types.resolvable import Float
 from ytdl_sub.script.types.resolvable import String
 from ytdl_sub.script.utils.exceptions import InvalidSyntaxException
 
+_UNEXPECTED_COMMA_ARRAY_MATCH = re.compile(
+    re.escape(str(_UNEXPECTED_COMMA_ARGUMENT(ParsedArgType.ARRAY)))
+)
+_UNEXPECTED_CHAR_ARRAY_MATCH = re.compile(
+    re.escape(str(_UNEXPECTED_CHAR_ARGUMENT(ParsedArgType.ARRAY)))
+)
+_UNEXPECTED_CHAR_SCRIPT_MATCH = re.compile(
+    re.escape(str(_UNEXPECTED_CHAR_ARGUMENT(ParsedArgType.SCRIPT)))
+)
+
 
 class TestArray:
     def test_return(self):
@@ -71,7 +81,7 @@ class TestArray:
     def test_unexpected_comma(self, array: str):
         with pytest.raises(
             InvalidSyntaxException,
-            match=re.escape(str(_UNEXPECTED_COMMA_ARGUMENT(ParsedArgType.ARRAY))),
+            match=_UNEXPECTED_COMMA_ARRAY_MATCH,
         ):
             Script({"arr": array}).resolve()
 
@@ -88,7 +98,7 @@ class TestArray:
     def test_array_not_closed(self, array: str):
         with pytest.raises(
             InvalidSyntaxException,
-            match=re.escape(str(_UNEXPECTED_CHAR_ARGUMENT(ParsedArgType.ARRAY))),
+            match=_UNEXPECTED_CHAR_ARRAY_MATCH,
         ):
             assert Script({"arr": array}).resolve()
 
@@ -102,7 +112,7 @@ class TestArray:
     def test_array_not_opened(self, array: str):
         with pytest.raises(
             InvalidSyntaxException,
-            match=re.escape(str(_UNEXPECTED_CHAR_ARGUMENT(ParsedArgType.SCRIPT))),
+            match=_UNEXPECTED_CHAR_SCRIPT_MATCH,
         ):
             assert Script({"arr": array}).resolve()
 
@@ -9,6 +9,8 @@ from ytdl_sub.script.types.resolvable import Boolean
 from ytdl_sub.script.types.resolvable import String
 from ytdl_sub.script.utils.exceptions import InvalidSyntaxException
 
+_BOOLEAN_ONLY_ARGS_MATCH = re.compile(re.escape(str(BOOLEAN_ONLY_ARGS)))
+
 
 class TestBool:
     @pytest.mark.parametrize(
@@ -21,7 +23,7 @@ class TestBool:
         ],
     )
     def test_boolean_not_arg(self, boolean: str):
-        with pytest.raises(InvalidSyntaxException, match=re.escape(str(BOOLEAN_ONLY_ARGS))):
+        with pytest.raises(InvalidSyntaxException, match=_BOOLEAN_ONLY_ARGS_MATCH):
             Script({"boolean": boolean}).resolve()
 
     @pytest.mark.parametrize(
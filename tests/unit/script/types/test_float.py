@@ -10,6 +10,9 @@ from ytdl_sub.script.types.resolvable import Float
 from ytdl_sub.script.types.resolvable import String
 from ytdl_sub.script.utils.exceptions import InvalidSyntaxException
 
+_NUMERICS_ONLY_ARGS_MATCH = re.compile(re.escape(str(NUMERICS_ONLY_ARGS)))
+_NUMERICS_INVALID_CHAR_MATCH = re.compile(re.escape(str(NUMERICS_INVALID_CHAR)))
+
 
 class TestFloat:
     @pytest.mark.parametrize(
@@ -24,7 +27,7 @@ class TestFloat:
         ],
     )
     def test_float_not_arg(self, integer: str):
-        with pytest.raises(InvalidSyntaxException, match=re.escape(str(NUMERICS_ONLY_ARGS))):
+        with pytest.raises(InvalidSyntaxException, match=_NUMERICS_ONLY_ARGS_MATCH):
             Script({"out": integer}).resolve()
 
     @pytest.mark.parametrize(
@@ -61,7 +64,7 @@ class TestFloat:
         ],
     )
     def test_invalid_float(self, float_: str):
-        with pytest.raises(InvalidSyntaxException, match=re.escape(str(NUMERICS_INVALID_CHAR))):
+        with pytest.raises(InvalidSyntaxException, match=_NUMERICS_INVALID_CHAR_MATCH):
             Script({"out": float_}).resolve()
 
     @pytest.mark.parametrize(
@@ -11,6 +11,7 @@ from ytdl_sub.script.utils.exceptions import FunctionDoesNotExist
 from ytdl_sub.script.utils.exceptions import FunctionRuntimeException
 from ytdl_sub.script.utils.exceptions import IncompatibleFunctionArguments
 from ytdl_sub.script.utils.exceptions import InvalidSyntaxException
+from ytdl_sub.script.utils.purity import is_pure
 
 
 def _incompatible_arguments_match(expected: str, recieved: str) -> str:
@@ -99,3 +100,12 @@ class TestFunction:
             assert output == 110
         finally:
             del Functions._custom_functions[mock_register_function.__name__]
+
+    def test_pure_function_output_is_cached(self):
+        assert is_pure(Functions.get("concat"))
+        assert not is_pure(Functions.get("if"))
+
+        first = Script({"out": "{%concat('pure', 'cache')}"}).resolve().get("out")
+        second = Script({"out": "{%concat('pure', 'cache')}"}).resolve().get("out")
+        assert first.value == "purecache"
+        assert first is second
@@ -11,6 +11,9 @@ from ytdl_sub.script.types.resolvable import Integer
 from ytdl_sub.script.types.resolvable import String
 from ytdl_sub.script.utils.exceptions import InvalidSyntaxException
 
+_NUMERICS_ONLY_ARGS_MATCH = re.compile(re.escape(str(NUMERICS_ONLY_ARGS)))
+_NUMERICS_INVALID_CHAR_MATCH = re.compile(re.escape(str(NUMERICS_INVALID_CHAR)))
+
 
 class TestInteger:
     @pytest.mark.parametrize(
@@ -25,7 +28,7 @@ class TestInteger:
         ],
     )
     def test_integer_not_arg(self, integer: str):
-        with pytest.raises(InvalidSyntaxException, match=re.escape(str(NUMERICS_ONLY_ARGS))):
+        with pytest.raises(InvalidSyntaxException, match=_NUMERICS_ONLY_ARGS_MATCH):
             Script({"integer": integer}).resolve()
 
     @pytest.mark.parametrize(
@@ -61,7 +64,7 @@ class TestInteger:
         ],
     )
     def test_invalid_integer(self, integer: str):
-        with pytest.raises(InvalidSyntaxException, match=re.escape(str(NUMERICS_INVALID_CHAR))):
+        with pytest.raises(InvalidSyntaxException, match=_NUMERICS_INVALID_CHAR_MATCH):
             Script({"integer": integer}).resolve()
 
     @pytest.mark.parametrize(
@@ -17,6 +17,15 @@ from ytdl_sub.script.types.resolvable import String
 from ytdl_sub.script.utils.exceptions import InvalidSyntaxException
 from ytdl_sub.script.utils.exceptions import KeyNotHashableRuntimeException
 
+_BRACKET_NOT_CLOSED_MATCH = re.compile(re.escape(str(BRACKET_NOT_CLOSED)))
+_MAP_KEY_WITH_NO_VALUE_MATCH = re.compile(re.escape(str(MAP_KEY_WITH_NO_VALUE)))
+_UNEXPECTED_COMMA_MAP_KEY_MATCH = re.compile(
+    re.escape(str(_UNEXPECTED_COMMA_ARGUMENT(ParsedArgType.MAP_KEY)))
+)
+_MAP_KEY_MULTIPLE_VALUES_MATCH = re.compile(re.escape(str(MAP_KEY_MULTIPLE_VALUES)))
+_MAP_MISSING_KEY_MATCH = re.compile(re.escape(str(MAP_MISSING_KEY)))
+_MAP_KEY_NOT_HASHABLE_MATCH = re.compile(re.escape(str(MAP_KEY_NOT_HASHABLE)))
+
 
 class TestMap:
     def test_return(self):
@@ -92,7 +101,7 @@ class TestMap:
         ],
     )
     def test_map_not_closed(self, map: str):
-        with pytest.raises(InvalidSyntaxException, match=re.escape(str(BRACKET_NOT_CLOSED))):
+        with pytest.raises(InvalidSyntaxException, match=_BRACKET_NOT_CLOSED_MATCH):
             Script({"dict": map}).resolve()
 
     @pytest.mark.parametrize(
@@ -108,7 +117,7 @@ class TestMap:
         ],
     )
     def test_key_has_no_value(self, value: str):
-        with pytest.raises(InvalidSyntaxException, match=re.escape(str(MAP_KEY_WITH_NO_VALUE))):
+        with pytest.raises(InvalidSyntaxException, match=_MAP_KEY_WITH_NO_VALUE_MATCH):
             Script({"dict": value}).resolve()
 
     @pytest.mark.parametrize(
@@ -123,7 +132,7 @@ class TestMap:
     def test_map_unexpected_comma(self, value: str):
         with pytest.raises(
             InvalidSyntaxException,
-            match=re.escape(str(_UNEXPECTED_COMMA_ARGUMENT(ParsedArgType.MAP_KEY))),
+            match=_UNEXPECTED_COMMA_MAP_KEY_MATCH,
         ):
             Script({"dict": value}).resolve()
 
@@ -136,7 +145,7 @@ class TestMap:
         ],
     )
     def test_map_multiple_keys(self, value: str):
-        with pytest.raises(InvalidSyntaxException, match=re.escape(str(MAP_KEY_MULTIPLE_VALUES))):
+        with pytest.raises(InvalidSyntaxException, match=_MAP_KEY_MULTIPLE_VALUES_MATCH):
             Script({"dict": value}).resolve()
 
     @pytest.mark.parametrize(
@@ -158,7 +167,7 @@ class TestMap:
         ],
     )
     def test_map_missing_key(self, value: str):
-        with pytest.raises(InvalidSyntaxException, match=re.escape(str(MAP_MISSING_KEY))):
+        with pytest.raises(InvalidSyntaxException, match=_MAP_MISSING_KEY_MATCH):
             Script({"dict": value}).resolve()
 
     @pytest.mark.parametrize(
@@ -171,7 +180,7 @@ class TestMap:
         ],
     )
     def test_map_key_not_hashable(self, value: str):
-        with pytest.raises(InvalidSyntaxException, match=re.escape(str(MAP_KEY_NOT_HASHABLE))):
+        with pytest.raises(InvalidSyntaxException, match=_MAP_KEY_NOT_HASHABLE_MATCH):
             Script({"dict": value}).resolve()
 
     def test_map_key_is_hashable_variable(self):
@@ -10,6 +10,9 @@ from ytdl_sub.script.script_output import ScriptOutput
 from ytdl_sub.script.types.resolvable import String
 from ytdl_sub.script.utils.exceptions import InvalidSyntaxException
 
+_STRINGS_ONLY_ARGS_MATCH = re.compile(re.escape(str(STRINGS_ONLY_ARGS)))
+_STRINGS_NOT_CLOSED_MATCH = re.compile(re.escape(str(STRINGS_NOT_CLOSED)))
+
 
 class TestString:
     @pytest.mark.parametrize(
@@ -24,7 +27,7 @@ class TestString:
         ],
     )
     def test_string_not_arg(self, string: str):
-        with pytest.raises(InvalidSyntaxException, match=re.escape(str(STRINGS_ONLY_ARGS))):
+        with pytest.raises(InvalidSyntaxException, match=_STRINGS_ONLY_ARGS_MATCH):
             Script({"out": string}).resolve()
 
     @pytest.mark.parametrize(
@@ -75,5 +78,5 @@ class TestString:
         ],
     )
     def test_string_not_closed_properly(self, string: str):
-        with pytest.raises(InvalidSyntaxException, match=re.escape(str(STRINGS_NOT_CLOSED))):
+        with pytest.raises(InvalidSyntaxException, match=_STRINGS_NOT_CLOSED_MATCH):
             Script({"out": string}).resolve()
@@ -0,0 +1,84 @@
+import os
+from pathlib import Path
+from typing import Type
+from unittest.mock import Mock
+from unittest.mock import patch
+
+import pytest
+
+from ytdl_sub.config.config_file import ConfigFile
+from ytdl_sub.subscriptions.subscription import Subscription
+from ytdl_sub.subscriptions.subscription_download import SAVE_DOWNLOAD_ARCHIVE_ENTRY_INTERVAL
+from ytdl_sub.subscriptions.subscription_download import _OrderedPlugins
+from ytdl_sub.utils.file_handler import FileMetadata
+
+
+@pytest.fixture
+def subscription(tmp_path: Path) -> Subscription:
+    config = ConfigFile(
+        name="config",
+        value={"configuration": {"working_directory": str(tmp_path / "working_directory")}},
+    )
+    return Subscription.from_dict(
+        config=config,
+        preset_name="test_subscription",
+        preset_dict={
+            "download": "https://www.youtube.com/watch?v=123abc",
+            "output_options": {
+                "output_directory": str(tmp_path / "output_directory"),
+                "file_name": "{uid}",
+                "maintain_download_archive": True,
+            },
+        },
+    )
+
+
+def _post_process_entries(subscription: Subscription, num_entries: int) -> None:
+    ordered_plugins = _OrderedPlugins.from_plugins([])
+    for _ in range(num_entries):
+        subscription._post_process_entry(
+            ordered_plugins=ordered_plugins,
+            dry_run=True,
+            entry=Mock(),
+            entry_metadata=FileMetadata(),
+        )
+
+
+def test_download_archive_saved_every_interval(subscription: Subscription):
+    num_entries = 2 * SAVE_DOWNLOAD_ARCHIVE_ENTRY_INTERVAL + 3
+    with (
+        patch.object(subscription, "_move_entry_files_to_output_directory"),
+        patch.object(subscription.download_archive, "save_download_mappings") as mock_save,
+    ):
+        with subscription._maintain_archive_file():
+            _post_process_entries(subscription, num_entries=num_entries)
+            assert mock_save.call_count == 2
+
+        # The remaining entries are saved when the subscription finishes
+        assert mock_save.call_count == 3
+
+
+@pytest.mark.parametrize("exception_type", [ValueError, KeyboardInterrupt, SystemExit])
+def test_download_archive_saved_on_error(
+    subscription: Subscription, exception_type: Type[BaseException]
+):
+    with (
+        patch.object(subscription, "_move_entry_files_to_output_directory"),
+        patch.object(subscription.download_archive, "save_download_mappings") as mock_save,
+    ):
+        with pytest.raises(exception_type), subscription._maintain_archive_file():
+            _post_process_entries(subscription, num_entries=3)
+            assert mock_save.call_count == 0
+            raise exception_type()
+
+        assert mock_save.call_count == 1
+
+
+def test_working_directory_deleted(subscription: Subscription):
+    os.makedirs(os.path.join(subscription.working_directory, "nested"))
+    Path(subscription.working_directory, "nested", "video.mp4").touch()
+
+    subscription._delete_working_directory()
+
+    assert not os.path.isdir(subscription.working_directory)
+    assert not os.listdir(os.path.dirname(subscription.working_directory))
@@ -1,6 +1,7 @@
 from pathlib import Path
 from typing import Any
 from typing import Dict
+from typing import List
 from typing import Type
 
 from tools.docgen.docgen import DocGen
@@ -28,22 +29,24 @@ class EntryVariablesDocGen(DocGen):
 
     @classmethod
     def generate(cls) -> str:
-        docs = section("Entry Variables", level=0)
+        docs: List[str] = [section("Entry Variables", level=0)]
 
         parent_objs: Dict[str, Type[Any]] = {
             _variable_class_to_name(obj): obj for obj in VariableDefinitions.__bases__
         }
 
         for idx, name in enumerate(sorted(parent_objs.keys())):
-            docs += line_section(section_idx=idx)
-            docs += section(name, level=1)
+            docs.append(line_section(section_idx=idx))
+            docs.append(section(name, level=1))
 
             for variable_function_name in cached_properties(parent_objs[name]):
-                docs += get_function_docs(
-                    function_name=variable_function_name,
-                    obj=parent_objs[name],
-                    pre_docstring=f":type: ``{getattr(VARIABLES, variable_function_name).human_readable_type()}``\n",
-                    level=2,
+                docs.append(
+                    get_function_docs(
+                        function_name=variable_function_name,
+                        obj=parent_objs[name],
+                        pre_docstring=f":type: ``{getattr(VARIABLES, variable_function_name).human_readable_type()}``\n",
+                        level=2,
+                    )
                 )
 
-        return docs
+        return "".join(docs)
@@ -1,11 +1,14 @@
-import inspect
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 from typing import Dict
+from typing import List
 from typing import Optional
+from typing import Tuple
 from typing import Type
 
 from tools.docgen.docgen import DocGen
+from tools.docgen.utils import cleandoc
 from tools.docgen.utils import line_section
 from tools.docgen.utils import properties
 from tools.docgen.utils import section
@@ -16,9 +19,8 @@ from ytdl_sub.config.preset_options import YTDLOptions
 from ytdl_sub.config.validators.options import OptionsValidator
 from ytdl_sub.downloaders.url.validators import MultiUrlValidator
 
-
-def should_filter_all_properties(plugin_name: str) -> bool:
-    return plugin_name in (
+_PLUGINS_WITHOUT_PROPERTY_DOCS = frozenset(
+    {
         "format",
         "match_filters",
         "music_tags",
@@ -27,11 +29,11 @@ def should_filter_all_properties(plugin_name: str) -> bool:
         "embed_thumbnail",
         "video_tags",
         "download",
-    )
-
+    }
+)
 
-def should_filter_property(property_name: str) -> bool:
-    return property_name.startswith("_") or property_name in (
+_FILTERED_PROPERTY_NAMES = frozenset(
+    {
         "value",
         "source_variable_capture_dict",
         "dict",
@@ -41,31 +43,61 @@ def should_filter_property(property_name: str) -> bool:
         "list",
         "script",
         "unresolvable",
-    )
+    }
+)
+
+
+def should_filter_all_properties(plugin_name: str) -> bool:
+    return plugin_name in _PLUGINS_WITHOUT_PROPERTY_DOCS
+
+
+def should_filter_property(property_name: str) -> bool:
+    return property_name.startswith("_") or property_name in _FILTERED_PROPERTY_NAMES
 
 
 def get_function_docs(function_name: str, obj: Any, level: int) -> str:
-    docs = f"\n``{function_name}``\n\n"
-    docs += inspect.cleandoc(getattr(obj, function_name).__doc__)
-    docs += "\n\n"
-    return docs
+    return "".join(
+        [
+            f"\n``{function_name}``\n\n",
+            cleandoc(getattr(obj, function_name).__doc__),
+            "\n\n",
+        ]
+    )
 
 
 def generate_plugin_docs(name: str, options: Type[OptionsValidator], offset: int) -> str:
-    docs = ""
-    docs += section(name, level=offset + 0)
-
-    docs += inspect.cleandoc(options.__doc__)
-    docs += "\n"
+    docs: List[str] = [
+        section(name, level=offset + 0),
+        cleandoc(options.__doc__),
+        "\n",
+    ]
 
     if should_filter_all_properties(name):
-        return docs
+        return "".join(docs)
 
     property_names = [prop for prop in properties(options) if not should_filter_property(prop)]
-    for property_name in sorted(property_names):
-        docs += get_function_docs(function_name=property_name, obj=options, level=offset + 1)
-
-    return docs
+    for property_name in property_names:
+        docs.append(get_function_docs(function_name=property_name, obj=options, level=offset + 1))
+
+    return "".join(docs)
+
+
+@lru_cache(maxsize=None)
+def _sorted_plugin_options() -> Tuple[Tuple[str, Type[OptionsValidator]], ...]:
+    """
+    Public plugin options keyed by their plugin name, sorted by name
+    """
+    options_dict: Dict[str, Type[OptionsValidator]] = {
+        "output_options": OutputOptions,
+        "ytdl_options": YTDLOptions,
+        "overrides": Overrides,
+        "download": MultiUrlValidator,
+    }
+    for plugin_name, plugin_type in PluginMapping._MAPPING.items():
+        if plugin_name.startswith("_"):
+            continue
+        options_dict[plugin_name] = plugin_type.plugin_options_type
+    return tuple(sorted(options_dict.items()))
 
 
 class PluginsDocGen(DocGen):
@@ -74,20 +106,9 @@ class PluginsDocGen(DocGen):
 
     @classmethod
     def generate(cls):
-        options_dict: Dict[str, Type[OptionsValidator]] = {
-            "output_options": OutputOptions,
-            "ytdl_options": YTDLOptions,
-            "overrides": Overrides,
-            "download": MultiUrlValidator,
-        }
-        for plugin_name, plugin_type in PluginMapping._MAPPING.items():
-            if plugin_name.startswith("_"):
-                continue
-            options_dict[plugin_name] = plugin_type.plugin_options_type
-
-        docs = section("Plugins", level=0)
-        for idx, name in enumerate(sorted(options_dict.keys())):
-            docs += line_section(section_idx=idx)
-            docs += generate_plugin_docs(name, options_dict[name], offset=1)
-
-        return docs
+        docs: List[str] = [section("Plugins", level=0)]
+        for idx, (name, options) in enumerate(_sorted_plugin_options()):
+            docs.append(line_section(section_idx=idx))
+            docs.append(generate_plugin_docs(name, options, offset=1))
+
+        return "".join(docs)
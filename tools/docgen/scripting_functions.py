@@ -1,12 +1,15 @@
-import inspect
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 from typing import Dict
+from typing import List
 from typing import Optional
+from typing import Tuple
 from typing import Type
 
 from tools.docgen.docgen import DocGen
 from tools.docgen.utils import camel_case_to_human
+from tools.docgen.utils import cleandoc
 from tools.docgen.utils import line_section
 from tools.docgen.utils import section
 from tools.docgen.utils import static_methods
@@ -14,9 +17,11 @@ from ytdl_sub.entries.script.custom_functions import CustomFunctions
 from ytdl_sub.script.functions import Functions
 from ytdl_sub.script.utils.type_checking import FunctionSpec
 
+_UNDOCUMENTED_FUNCTION_NAMES = frozenset({"register"})
+
 
 def maybe_get_function_name(function_name: str) -> Optional[str]:
-    if function_name in ["register"]:
+    if function_name in _UNDOCUMENTED_FUNCTION_NAMES:
         return None
 
     if function_name.endswith("_"):
@@ -29,15 +34,17 @@ def function_class_to_name(obj: Type[Any]) -> str:
     return camel_case_to_human(obj.__name__)
 
 
+@lru_cache(maxsize=None)
+def _function_spec(display_function_name: str, function: Any) -> FunctionSpec:
+    return FunctionSpec.from_callable(name=display_function_name, callable_ref=function)
+
+
 def function_type_hinting(display_function_name: str, function: Any) -> str:
-    spec = FunctionSpec.from_callable(name=display_function_name, callable_ref=function)
-    out = ":spec: ``"
-    out += display_function_name
-    out += spec.human_readable_input_args()
-    out += " -> "
-    out += spec.human_readable_output_type()
-    out += "``\n\n"
-    return out
+    spec = _function_spec(display_function_name=display_function_name, function=function)
+    return (
+        f":spec: ``{display_function_name}{spec.human_readable_input_args()} -> "
+        f"{spec.human_readable_output_type()}``\n\n"
+    )
 
 
 def get_function_docstring(
@@ -45,12 +52,26 @@ def get_function_docstring(
 ) -> str:
     display_function_name = display_function_name if display_function_name else function_name
 
-    docs = section(display_function_name, level=level)
+    return "".join(
+        [
+            section(display_function_name, level=level),
+            function_type_hinting(display_function_name=display_function_name, function=function),
+            cleandoc(function.__doc__),
+            "\n",
+        ]
+    )
 
-    docs += function_type_hinting(display_function_name=display_function_name, function=function)
-    docs += inspect.cleandoc(function.__doc__)
-    docs += "\n"
-    return docs
+
+@lru_cache(maxsize=None)
+def _sorted_function_classes() -> Tuple[Tuple[str, Type[Any]], ...]:
+    """
+    Function classes keyed by their section name, sorted by name
+    """
+    function_classes: Dict[str, Type[Any]] = {
+        function_class_to_name(obj): obj for obj in Functions.__bases__
+    }
+    function_classes["Ytdl-Sub Functions"] = CustomFunctions
+    return tuple(sorted(function_classes.items()))
 
 
 class ScriptingFunctionsDocGen(DocGen):
@@ -59,29 +80,26 @@ class ScriptingFunctionsDocGen(DocGen):
 
     @classmethod
     def generate(cls) -> str:
-        docs = section("Scripting Functions", level=0)
-
-        parent_objs: Dict[str, Type[Any]] = {
-            function_class_to_name(obj): obj for obj in Functions.__bases__
-        }
-        parent_objs["Ytdl-Sub Functions"] = CustomFunctions
+        docs: List[str] = [section("Scripting Functions", level=0)]
 
-        for idx, name in enumerate(sorted(parent_objs.keys())):
-            docs += line_section(section_idx=idx)
-            docs += section(name, level=1)
+        for idx, (name, function_class) in enumerate(_sorted_function_classes()):
+            docs.append(line_section(section_idx=idx))
+            docs.append(section(name, level=1))
 
-            for function_name in static_methods(parent_objs[name]):
+            for function_name in static_methods(function_class):
                 if display_function_name := maybe_get_function_name(function_name):
                     try:
-                        docs += get_function_docstring(
-                            function_name=function_name,
-                            display_function_name=display_function_name,
-                            function=getattr(parent_objs[name], function_name),
-                            level=2,
+                        docs.append(
+                            get_function_docstring(
+                                function_name=function_name,
+                                display_function_name=display_function_name,
+                                function=getattr(function_class, function_name),
+                                level=2,
+                            )
                         )
                     except Exception as exc:
                         raise ValueError(
                             f"Invalid docs for function {display_function_name}"
                         ) from exc
 
-        return docs
+        return "".join(docs)
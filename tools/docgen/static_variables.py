@@ -1,4 +1,5 @@
 from pathlib import Path
+from typing import List
 
 from tools.docgen.docgen import DocGen
 from tools.docgen.utils import get_function_docs
@@ -13,14 +14,17 @@ class StaticVariablesDocGen(DocGen):
 
     @classmethod
     def generate(cls) -> str:
-        docs = section("Static Variables", level=0)
-
-        docs += section("Subscription Variables", level=1)
+        docs: List[str] = [
+            section("Static Variables", level=0),
+            section("Subscription Variables", level=1),
+        ]
         for name in static_methods(SubscriptionVariables):
-            docs += get_function_docs(
-                function_name=name,
-                obj=SubscriptionVariables,
-                level=2,
+            docs.append(
+                get_function_docs(
+                    function_name=name,
+                    obj=SubscriptionVariables,
+                    level=2,
+                )
             )
 
-        return docs
+        return "".join(docs)
@@ -1,5 +1,6 @@
 import inspect
 from functools import cached_property
+from functools import lru_cache
 from typing import Any
 from typing import Dict
 from typing import List
@@ -15,29 +16,46 @@ def section(name: str, level: int, as_code: bool = False) -> str:
     return f"\n{name}\n{len(name) * LEVEL_CHARS[level]}\n"
 
 
+@lru_cache(maxsize=None)
+def cleandoc(doc: str) -> str:
+    """
+    inspect.cleandoc, cached since inherited properties share the same docstrings
+    """
+    return inspect.cleandoc(doc)
+
+
+def _class_attributes(obj: Type[Any]) -> Dict[str, Any]:
+    """
+    Raw class attributes resolved through the MRO in a single pass, without triggering
+    descriptor lookups per attribute like dir() + getattr() does
+    """
+    attributes: Dict[str, Any] = {}
+    for klass in reversed(obj.__mro__):
+        attributes.update(vars(klass))
+    return attributes
+
+
 def properties(obj: Type[Any]) -> List[str]:
-    return sorted(prop for prop in dir(obj) if isinstance(getattr(obj, prop), property))
+    return sorted(
+        name for name, value in _class_attributes(obj).items() if isinstance(value, property)
+    )
 
 
 def cached_properties(obj: Type[Any]) -> List[str]:
-    return sorted(prop for prop in dir(obj) if isinstance(getattr(obj, prop), cached_property))
+    return sorted(
+        name for name, value in _class_attributes(obj).items() if isinstance(value, cached_property)
+    )
 
 
 def static_methods(obj: Type[Any]) -> List[str]:
     return sorted(
-        name for name in dir(obj) if isinstance(inspect.getattr_static(obj, name), staticmethod)
+        name for name, value in _class_attributes(obj).items() if isinstance(value, staticmethod)
     )
 
 
+@lru_cache(maxsize=None)
 def camel_case_to_human(string: str) -> str:
-    output_str = string[0]
-    for char in string[1:]:
-        if char.islower():
-            output_str += char
-        else:
-            output_str += f" {char}"
-
-    return output_str
+    return string[0] + "".join(char if char.islower() else f" {char}" for char in string[1:])
 
 
 def get_function_docs(
@@ -49,11 +67,14 @@ def get_function_docs(
 ) -> str:
     display_function_name = display_function_name if display_function_name else function_name
 
-    docs = section(display_function_name, level=level)
-    docs += pre_docstring or ""
-    docs += inspect.cleandoc(getattr(obj, function_name).__doc__)
-    docs += "\n"
-    return docs
+    return "".join(
+        [
+            section(display_function_name, level=level),
+            pre_docstring or "",
+            cleandoc(getattr(obj, function_name).__doc__),
+            "\n",
+        ]
+    )
 
 
 def line() -> str: